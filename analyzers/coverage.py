@@ -3,12 +3,14 @@
 DEFAULT_LISTENER_LATLON = '47.61262,-122.32944'
 DEFAULT_LISTENER_ALT = '100'
 
+from matplotlib.collections import LineCollection
 from pyproj import Transformer
 import argparse
 import contextily as cx
 import glob
 import matplotlib
 import matplotlib.pyplot as plt
+import numpy as np
 import os
 import pandas as pd
 import sys
@@ -52,10 +54,13 @@ def plot(logfile_dir, listener_lat, listener_lon, listener_alt):
 
     fig, ax = plt.subplots(figsize=(25, 25))
     ax.axis('off')
-    heard_points = to_mercator_xy(df.lat, df.lon)
-    heard_points = zip(heard_points[0], heard_points[1])
-    for point in heard_points:
-        ax.plot([home_x, point[0]], [home_y, point[1]], color='red', alpha=0.01)
+    # Draw a line from home to every heard point as a single collection;
+    # adding one Line2D artist per point gets very slow with big logs
+    heard_x, heard_y = to_mercator_xy(df.lat, df.lon)
+    home = np.broadcast_to([home_x, home_y], (len(df), 2))
+    segments = np.stack([home, np.column_stack([heard_x, heard_y])], axis=1)
+    ax.add_collection(LineCollection(segments, color='red', alpha=0.01))
+    ax.autoscale_view()
     cx.add_basemap(
         ax,
         source=cx.providers.OpenStreetMap.Mapnik,
@@ -44,7 +44,9 @@ def get_listeners(sondeid):
     print(agg.to_string())
 
     print("\nNumber of points heard by:")
-    who_per_point = df.groupby('frame')['uploader_callsign'].agg(lambda x: ",".join(sorted(set(x))))
+    heard = df[['frame', 'uploader_callsign']].drop_duplicates()
+    heard = heard.sort_values(['frame', 'uploader_callsign'])
+    who_per_point = heard.groupby('frame')['uploader_callsign'].agg(",".join)
     print(who_per_point.value_counts().to_string())
 
 if __name__ == "__main__":
@@ -149,11 +149,15 @@ def get_nearest_sonde_flight(sondes, config):
             (path['azi1'] + 360) % 360
         )
 
-    # Annotate all landing records with distance from home
-    sondes[['dist_from_home_mi', 'bearing_from_home']] = sondes.apply(
-        lambda s: get_path(s) if s.phase == 'landing' else (None, None),
-        axis=1,
-        result_type='expand')
+    # Annotate all landing records with distance from home. Only landings are
+    # ever compared, so don't walk the (much larger) set of other records.
+    landings = sondes.loc[sondes.phase == 'landing']
+    paths = pd.DataFrame(
+        [get_path(s) for s in landings.itertuples()],
+        index=landings.index,
+        columns=['dist_from_home_mi', 'bearing_from_home'])
+    sondes['dist_from_home_mi'] = paths.dist_from_home_mi
+    sondes['bearing_from_home'] = paths.bearing_from_home
 
     #f = sondes.sort_values('dist_from_home_mi')
     #print(f[f.phase == 'landing'].to_string())
@@ -179,12 +183,12 @@ def to_mercator_xy(lat, lon):
 MAP_WHITESPACE = 0.2
 
 def get_limit(points):
-    min_lat = min([point[0] for point in points])
-    max_lat = max([point[0] for point in points])
-    min_lon = min([point[1] for point in points])
-    max_lon = max([point[1] for point in points])
-    min_x, min_y = to_mercator_xy(min_lat, min_lon)
-    max_x, max_y = to_mercator_xy(max_lat, max_lon)
+    # Mercator x depends only on lon and y only on lat, so projecting every
+    # point in one batched call and taking the extremes gives the same box
+    lats, lons = zip(*points)
+    xs, ys = to_mercator_xy(lats, lons)
+    min_x, max_x = min(xs), max(xs)
+    min_y, max_y = min(ys), max(ys)
     x_pad = (max_x - min_x) * MAP_WHITESPACE
     y_pad = (max_y - min_y) * MAP_WHITESPACE
     max_pad = max(x_pad, y_pad)
@@ -7,12 +7,10 @@ from folium.plugins import HeatMap
 # Read summaries
 df = pd.read_parquet('sonde-summaries-2022.parquet')
 
-# Get landings only
-df = df.loc[(df.vel_v < 0) & (df.alt < 10000)]
-
-# Get west coast only
-df = df.loc[(df.lat > 30) & (df.lat < 55)]
-df = df.loc[(df.lon > -125) & (df.lon < -100)]
+# Get west coast landings only, in a single pass over the year of data
+landings = (df.vel_v < 0) & (df.alt < 10000)
+west_coast = (df.lat > 30) & (df.lat < 55) & (df.lon > -125) & (df.lon < -100)
+df = df.loc[landings & west_coast]
 
 # Draw heatmap
 fmap = folium.Map()
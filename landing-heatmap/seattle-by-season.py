@@ -4,9 +4,10 @@ import calendar
 import contextily as cx
 import geopandas
 import matplotlib.pyplot as plt
+import os
 import pandas as pd
 
-cx.set_cache_dir("/tmp/cached-tiles")
+cx.set_cache_dir(os.path.expanduser("~/.cache/geotiles"))
 
 LAT_MIN = 46
 LAT_MAX = 49
@@ -16,12 +17,10 @@ LON_MAX = -121
 def main():
     df = pd.read_parquet('sonde-summaries-2022.parquet')
 
-    # get landings
-    df = df.loc[(df.vel_v < 0) & (df.alt < 10000)]
-
-    # get local landings
-    df = df.loc[(df.lat >= LAT_MIN) & (df.lat <= LAT_MAX)]
-    df = df.loc[(df.lon >= LON_MIN) & (df.lon <= LON_MAX)]
+    # get local landings, in a single pass over the year of data
+    landings = (df.vel_v < 0) & (df.alt < 10000)
+    local = df.lat.between(LAT_MIN, LAT_MAX) & df.lon.between(LON_MIN, LON_MAX)
+    df = df.loc[landings & local]
 
     # annotate with month
     df['datetime'] = pd.to_datetime(df['datetime'])
@@ -33,7 +33,7 @@ def get_recs_from_tar(infilename):
                 continue
             num_files += 1
 
-            j = json.load(archive.extractfile(f.name))
+            j = json.load(archive.extractfile(f))
             for rec in j:
                 num_recs += 1
                 yield rec
@@ -2,11 +2,12 @@
 
 import pandas as pd
 import sys
-import datetime
 
 def get_df(filename):
-    data = open(filename).readlines()
-    metadata = [line for line in data if line.startswith('#USM')]
+    # only the header lines are needed, so filter while streaming rather than
+    # holding the whole (large) sounding file in memory
+    with open(filename) as f:
+        metadata = [line for line in f if line.startswith('#USM')]
     df = pd.DataFrame([line.split() for line in metadata])
     df = df.rename({
         1: 'year',
@@ -30,26 +31,23 @@ def get_df(filename):
 
     # create a datetime object to represent the exact launch date and time.
     # nominal midnight launches are (i think) always launched the night before
-    def get_launch_time(r):
-        reltime = datetime.datetime(
-            year=r['year'],
-            month=r['month'],
-            day=r['day'],
-            hour=int(r['reltime']/100),
-            minute=r['reltime']%100,
-        )
-        if r['nomhr'] == 0 and reltime.hour > 12:
-            reltime -= datetime.timedelta(days=1)
-        return pd.to_datetime(reltime)
-    df['launch_dt'] = df.apply(get_launch_time, axis=1)
+    launch_dt = pd.to_datetime(pd.DataFrame({
+        'year': df['year'],
+        'month': df['month'],
+        'day': df['day'],
+        'hour': df['reltime'] // 100,
+        'minute': df['reltime'] % 100,
+    }))
+    night_before = (df['nomhr'] == 0) & (launch_dt.dt.hour > 12)
+    launch_dt[night_before] -= pd.Timedelta(days=1)
+    df['launch_dt'] = launch_dt
 
-    df['nom_dt'] = df.apply(
-        lambda r: pd.to_datetime(datetime.datetime(
-            year=r['year'],
-            month=r['month'],
-            day=r['day'],
-            hour=r['nomhr'],
-        )), axis=1)
+    df['nom_dt'] = pd.to_datetime(pd.DataFrame({
+        'year': df['year'],
+        'month': df['month'],
+        'day': df['day'],
+        'hour': df['nomhr'],
+    }))
 
     return df
 
@@ -58,9 +56,7 @@ def main():
     in_filename = sys.argv[1]
     df = get_df(in_filename)
     df['year_month'] = df['launch_dt'].dt.to_period('M')
-    df['nom_to_launch_minutes'] = df.apply(
-        lambda r: (r['launch_dt'] - r['nom_dt']).total_seconds() / 60,
-        axis=1)
+    df['nom_to_launch_minutes'] = (df['launch_dt'] - df['nom_dt']).dt.total_seconds() / 60
     df = df[['year_month', 'nomhr', 'nom_to_launch_minutes']]
     groups = df.groupby(['year_month', 'nomhr'])
     launch_times = pd.concat([